@@ -54,7 +54,7 @@ __all__ = ('Graph', 'Plot', 'MeshLinePlot', 'MeshStemPlot', 'LinePlot',
            'SmoothLinePlot', 'ContourPlot', 'ScatterPlot', 'PointPlot',
            'LineAndMarkerPlot')
 
-from typing import Optional, List, Tuple, Any, Callable, Union
+from typing import Optional, List, Tuple, Any, Callable, Union, Dict
 
 from kivy.graphics.instructions import InstructionGroup, Instruction
 from kivy.graphics.vertex_instructions import Line, SmoothLine, Ellipse
@@ -76,7 +76,7 @@ from kivy.lang import Builder
 from kivy.logger import Logger
 from kivy import metrics
 from math import log10, floor, ceil, sqrt
-from decimal import Decimal
+from array import array
 from itertools import chain
 try:
     import numpy as np
@@ -94,6 +94,105 @@ def exp10(x):
     return 10 ** x
 
 
+def _copy_size(instance, size):
+    instance.size = size
+
+
+def _apply_options(label, options):
+    # set the label options, skipping those that a previous call already set
+    # to the same value. Each property set dispatches, even if unchanged
+    applied = label.__dict__.setdefault('_applied_options', {})
+    for key, value in options.items():
+        if key in applied and applied[key] == value:
+            continue
+        setattr(label, key, value)
+        applied[key] = value
+
+
+def _frozen(value):
+    # a copy of value for comparing it later, if value is a list or tuple
+    if isinstance(value, (list, tuple)):
+        return tuple(value)
+    return value
+
+
+def _log_ticks(start_dec: float, decade_dist: float, min_pos: float,
+               count_min: float, minor: float, s_max: float, n_ticks: int
+               ) -> Tuple[List[float], List[float]]:
+    """Returns the major and minor tick positions of a logarithmic axis, in
+    log scale. `start_dec` is the first tick location in decades, `n_ticks`
+    the maximum number of major or minor ticks. See :meth:`Graph._get_ticks`.
+
+    The function only uses floats and lists of floats, so it can be compiled
+    as is, e.g. by Cython in pure Python mode.
+    """
+    points_minor: List[float] = [0.] * n_ticks
+    points_major: List[float] = [0.] * n_ticks
+    k: int = 0  # position in points major
+    k2: int = 0  # position in points minor
+    count: int = 0  # number of ticks we currently have passed start
+    # local names are faster to look up in the loop than globals
+    floor_, ceil_, log10_ = floor, ceil, log10
+    while True:
+        # this is the current position in decade that we are.
+        # e.g. -0.9 means that we're at 0.1 of the 10**ceil(-0.9)
+        # decade
+        pos_dec = start_dec + decade_dist * count
+        pos_dec_low = floor_(pos_dec)
+        diff = pos_dec - pos_dec_low
+        zero = abs(diff) < 0.001 * decade_dist
+        if zero:
+            # the same value as pos_dec but in log scale
+            pos_log = pos_dec_low
+        else:
+            pos_log = log10_((pos_dec - pos_dec_low) * 10 ** ceil_(pos_dec))
+        if pos_log > s_max:
+            break
+        count += 1
+        if zero or diff >= min_pos:
+            if minor and not count_min % minor:
+                points_major[k] = pos_log
+                k += 1
+            else:
+                points_minor[k2] = pos_log
+                k2 += 1
+        count_min += 1
+    del points_major[k:]
+    del points_minor[k2:]
+    return points_major, points_minor
+
+
+def _log_ticks_numpy(start_dec, decade_dist, min_pos, count_min, minor, s_max):
+    """Computes the same ticks as :func:`_log_ticks` for all tick candidates
+    at once, using numpy. Returns None if the candidates do not reach s_max.
+    """
+    # ticks that are skipped because they fall in < min_pos still count, so
+    # generate candidates up to a few decades past s_max and cut them at the
+    # first one beyond s_max, where the loop of _log_ticks stops
+    n = int(ceil((s_max + 3 - start_dec) / decade_dist)) + 2
+    pos_dec = start_dec + decade_dist * np.arange(n)
+    pos_dec_low = np.floor(pos_dec)
+    diff = pos_dec - pos_dec_low
+    zero = np.abs(diff) < 0.001 * decade_dist
+    value = np.where(zero, 1., diff * np.power(10., np.ceil(pos_dec)))
+    pos_log = np.where(zero, pos_dec_low, np.log10(value))
+    # numpy's log10 may differ from math.log10 in the last bit, so compute the
+    # ticks close to s_max like _log_ticks, to cut off the same ticks
+    for i in np.flatnonzero(~zero & (np.abs(pos_log - s_max) < 1e-9)):
+        pos_log[i] = log10(value[i])
+    above = np.flatnonzero(pos_log > s_max)
+    if not len(above):
+        return None
+    end = above[0]
+    count = np.flatnonzero((zero | (diff >= min_pos))[:end])
+    pos_log = pos_log[count]
+    if minor:
+        is_major = (count_min + count) % minor == 0
+    else:
+        is_major = np.zeros(len(count), dtype=bool)
+    return pos_log[is_major].tolist(), pos_log[~is_major].tolist()
+
+
 Builder.load_string("""
 <GraphRotatedLabel>:
     canvas.before:
@@ -123,6 +222,35 @@ class YAxis(Axis):
     pass
 
 
+class AxisInfo(object):
+    '''Scale and range of an additional axis, see :meth:`Graph.add_x_axis`
+    and :meth:`Graph.add_y_axis`.
+
+    The values can also be accessed by key, e.g. ``info["min"]``.
+    '''
+
+    __slots__ = ('log', 'min', 'max')
+
+    def __init__(self, log, min, max):
+        self.log = log
+        self.min = min
+        self.max = max
+
+    def __getitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __repr__(self):
+        return 'AxisInfo(log={!r}, min={!r}, max={!r})'.format(
+            self.log, self.min, self.max)
+
+
 Builder.load_string("""
 <GraphLegend>:
     orientation: "vertical"
@@ -230,12 +358,12 @@ class Graph(Widget):
     _mesh_ticks = ObjectProperty(None)
     # the mesh which draws the surrounding rectangle
     _mesh_rect = ObjectProperty(None)
-    # a list of locations of major and minor ticks. The values are not
-    # but is in the axis min - max range
-    _ticks_majorx = ListProperty([])
-    _ticks_minorx = ListProperty([])
-    _ticks_majory = ListProperty([])
-    _ticks_minory = ListProperty([])
+    # the locations of major and minor ticks, as array('d'). The values are
+    # not but is in the axis min - max range
+    _ticks_majorx = ObjectProperty(array('d'))
+    _ticks_minorx = ObjectProperty(array('d'))
+    _ticks_majory = ObjectProperty(array('d'))
+    _ticks_minory = ObjectProperty(array('d'))
 
     tick_color = ListProperty([.25, .25, .25, 1])
     '''Color of the grid/ticks, default to 1/4. grey.
@@ -300,17 +428,19 @@ class Graph(Widget):
         else:
             return False
         self._legend_plots = []
+        self._legend_sig = None
         self._legend.canvas.clear()
         for name, plot in legend:
             options = self.label_options.copy()
             options.update(**self.legend_label_options)
             label = Label(text=name, **options, size_hint=(None, None))
-            def set_size(instance, size):
-                instance.size = size
-            label.bind(texture_size=set_size)
-            drawings = plot.create_legend_drawings()
-            for drawing in drawings:
-                self._legend.canvas.add(drawing)
+            label._applied_options = options
+            label.bind(texture_size=_copy_size)
+            # collect the drawings in a group to add them to the canvas at once
+            group = InstructionGroup()
+            for drawing in plot.create_legend_drawings():
+                group.add(drawing)
+            self._legend.canvas.add(group)
             self._legend_plots.append(plot)
             self._legend.add_widget(label)
         return True
@@ -344,6 +474,8 @@ class Graph(Widget):
     def __init__(self, **kwargs):
         self._legend: Optional[GraphLegend] = None
         self._legend_plots: Tuple[Plot, ...] = tuple()
+        # the plots and geometry of the last drawn legend markers
+        self._legend_sig = None
         super(Graph, self).__init__(**kwargs)
 
         with self.canvas:
@@ -363,13 +495,52 @@ class Graph(Widget):
             self._fbo_rect = Rectangle(
                 size=self.size, texture=self._fbo.texture)
 
+        # texture sizes of the tick label texts, keyed by text. They only
+        # depend on the label options, so they are kept until _redraw_all
+        self._tick_label_sizes = {}
+        # the inputs of the last _update_ticks call, None if outdated
+        self._ticks_key = None
+        # the plotting area and size last used by _redraw_size
+        self._view_key = None
+        # the inputs of the last _redraw_x and _redraw_y calls
+        self._redraw_x_key = None
+        self._redraw_y_key = None
+        # see _get_tick_label_options
+        self._tick_label_options = None
+        self.bind(label_options=self._reset_tick_label_options,
+                  tick_label_options=self._reset_tick_label_options)
+        # hidden tick labels, which are not used for the current ticks
+        self._x_grid_label_pool = []
+        self._y_grid_label_pool = []
+        # vertex and index buffers of the ticks mesh. They only grow in
+        # _redraw_all, the mesh uses views of them for the current ticks
+        if np is not None:
+            self._ticks_buffer = np.zeros(0, dtype=np.float32)
+            self._ticks_indices = np.zeros(0, dtype=np.uint16)
+        else:
+            self._ticks_buffer = array('f')
+            self._ticks_indices = array('H')
+        self._ticks_vertices = self._ticks_buffer
+
         mesh = self._mesh_rect
-        mesh.vertices = [0] * (5 * 4)
+        # a float32 buffer is used in place by Mesh, see _update_ticks
+        self._rect_vertices = array('f', [0] * (5 * 4))
+        mesh.vertices = self._rect_vertices
         mesh.indices = range(5)
 
         self._plot_area = StencilView()
         self.add_widget(self._plot_area)
 
+        # the instruction groups of the plots on the plotting area
+        self._plot_groups = {}
+
+        # cached by to_data, until the axes or the plotting area change
+        self._to_data_params = None
+        reset = self._reset_to_data_params
+        self._plot_area.bind(pos=reset, size=reset)
+        self.bind(xmin=reset, xmax=reset, xlog=reset, ymin=reset, ymax=reset,
+                  ylog=reset)
+
         t = self._trigger = Clock.create_trigger(self._redraw_all)
         ts = self._trigger_size = Clock.create_trigger(self._redraw_size)
         tc = self._trigger_color = Clock.create_trigger(self._update_colors)
@@ -413,6 +584,10 @@ class Graph(Widget):
             if log:
                 points_major = [log10(p) for p in points_major]
                 points_minor = [log10(p) for p in points_minor]
+            # the given ticks may be in any order, the generated ones below
+            # are already ordered from s_min to s_max
+            points_major.sort(reverse=s_min > s_max)
+            points_minor.sort(reverse=s_min > s_max)
         elif major > 0:
             minor = max(minor, 0)
             if log and s_max > s_min:
@@ -440,71 +615,68 @@ class Graph(Widget):
                 # between ticks
                 decade_dist = major / float(minor if minor else 1.0)
 
-                points_minor = [0] * n_ticks
-                points_major = [0] * n_ticks
-                k = 0  # position in points major
-                k2 = 0  # position in points minor
                 # because each decade is missing 0.1 of the decade, if a tick
                 # falls in < min_pos skip it
                 min_pos = 0.1 - 0.00001 * decade_dist
                 s_min_low = floor(s_min)
                 # first real tick location. value is in fractions of decades
-                # from the start we have to use decimals here, otherwise
-                # floating point inaccuracies results in bad values
-                start_dec = ceil((10 ** Decimal(s_min - s_min_low - 1)) /
-                                 Decimal(decade_dist)) * decade_dist
+                # from the start. floating point inaccuracies can push a tick
+                # that sits exactly on s_min just above an integer multiple
+                # of decade_dist, so snap to it before rounding up
+                start_dec = ceil(10 ** (s_min - s_min_low - 1) / decade_dist
+                                 - 1e-12) * decade_dist
                 count_min = (0 if not minor else
                              floor(start_dec / decade_dist) % minor)
                 start_dec += s_min_low
-                count = 0  # number of ticks we currently have passed start
-                while True:
-                    # this is the current position in decade that we are.
-                    # e.g. -0.9 means that we're at 0.1 of the 10**ceil(-0.9)
-                    # decade
-                    pos_dec = start_dec + decade_dist * count
-                    pos_dec_low = floor(pos_dec)
-                    diff = pos_dec - pos_dec_low
-                    zero = abs(diff) < 0.001 * decade_dist
-                    if zero:
-                        # the same value as pos_dec but in log scale
-                        pos_log = pos_dec_low
-                    else:
-                        pos_log = log10((pos_dec - pos_dec_low
-                                         ) * 10 ** ceil(pos_dec))
-                    if pos_log > s_max:
-                        break
-                    count += 1
-                    if zero or diff >= min_pos:
-                        if minor and not count_min % minor:
-                            points_major[k] = pos_log
-                            k += 1
-                        else:
-                            points_minor[k2] = pos_log
-                            k2 += 1
-                    count_min += 1
+                ticks = None
+                # numpy only pays off for many ticks, e.g. many decades
+                if np is not None and n_ticks > 64:
+                    ticks = _log_ticks_numpy(
+                        start_dec, decade_dist, min_pos, count_min, minor,
+                        s_max)
+                if ticks is None:
+                    ticks = _log_ticks(
+                        start_dec, decade_dist, min_pos, count_min, minor,
+                        s_max, n_ticks)
+                points_major, points_minor = ticks
+                k = len(points_major)
+                k2 = len(points_minor)
             elif not log and s_max != s_min:
                 # distance between each tick
                 tick_dist = major / float(minor if minor else 1.0)
                 n_ticks = int(floor(abs((s_max - s_min) / tick_dist)) + 1)
                 tick_dist = abs(tick_dist) * (1 if s_min < s_max else -1)
-                points_major = [0] * int(floor(abs((s_max - s_min) / float(major)))
-                                         + 1)
-                points_minor = [0] * (n_ticks - len(points_major) + 1)
-                k = 0  # position in points major
-                k2 = 0  # position in points minor
-                for m in range(0, n_ticks):
-                    if minor and m % minor:
-                        points_minor[k2] = m * tick_dist + s_min
-                        k2 += 1
+                if np is not None:
+                    # compute all the ticks at once and split them into major
+                    # and minor ticks by their index
+                    idx = np.arange(n_ticks)
+                    values = idx * tick_dist + s_min
+                    if minor:
+                        is_minor = (idx % minor) != 0
+                        points_minor = values[is_minor].tolist()
+                        points_major = values[~is_minor].tolist()
                     else:
-                        points_major[k] = m * tick_dist + s_min
-                        k += 1
+                        points_major = values.tolist()
+                    k = len(points_major)
+                    k2 = len(points_minor)
+                else:
+                    points_major = [0] * int(
+                        floor(abs((s_max - s_min) / float(major))) + 1)
+                    points_minor = [0] * (n_ticks - len(points_major) + 1)
+                    k = 0  # position in points major
+                    k2 = 0  # position in points minor
+                    for m in range(0, n_ticks):
+                        if minor and m % minor:
+                            points_minor[k2] = m * tick_dist + s_min
+                            k2 += 1
+                        else:
+                            points_major[k] = m * tick_dist + s_min
+                            k += 1
             else:
                 k = k2 = 1
             del points_major[k:]
             del points_minor[k2:]
-        return sorted(points_major, reverse=s_min > s_max),\
-               sorted(points_minor, reverse=s_min > s_max)
+        return points_major, points_minor
 
     def _update_labels(self):
         xlabel = self._xlabel
@@ -521,7 +693,6 @@ class Graph(Widget):
         ymin = self.ymin
         ymax = self.ymax
         xmin = self.xmin
-        precision = self.precision
         x_overlap = False
         y_overlap = False
         # set up x and y axis labels
@@ -544,35 +715,30 @@ class Graph(Widget):
         ylabel_grid = self.y_grid_label
         ypoints = self._ticks_majory
         ylabels = self._y_grid_label
+        sizes = self._tick_label_sizes
         # now x and y tick mark labels
         if len(ylabels) and ylabel_grid:
             # horizontal size of the largest tick label, to have enough room
-            funcexp = exp10 if self.ylog else identity
-            funclog = log10 if self.ylog else identity
-            get_text = \
-                (lambda _k: self.y_grid_label(funcexp(ypoints[_k]))) if isinstance(self.y_grid_label, Callable) else \
-                self.y_grid_label.__getitem__ if isinstance(self.y_grid_label, (tuple, list, str)) else \
-                lambda _k: precision % funcexp(ypoints[_k])
-            ylabels[0].text = get_text(0)
-            ylabels[0].texture_update()
-            y1 = ylabels[0].texture_size
+            get_text = self._tick_texts(
+                ypoints, self.ylog, self.y_grid_label).__getitem__
+            y1 = self._fit_label(ylabels[0], get_text(0), sizes)
             y_start = y_next + (padding + y1[1] if len(xlabels) and xlabel_grid
                                 else 0) + \
                                (padding + y1[1] if not y_next else 0)
             yextent = y + height - padding - y1[1] / 2.
 
-            ymin = funclog(ymin)
-            ratio = (yextent - y_start) / float(funclog(ymax) - ymin)
+            if self.ylog:
+                ymin = log10(ymin)
+                ymax = log10(ymax)
+            ratio = (yextent - y_start) / float(ymax - ymin)
             y_start -= y1[1] / 2.
             y1 = y1[0]
             for k in range(len(ylabels)):
                 try:
-                    ylabels[k].text = get_text(k)
+                    text = get_text(k)
                 except IndexError:
                     break
-                ylabels[k].texture_update()
-                ylabels[k].size = ylabels[k].texture_size
-                y1 = max(y1, ylabels[k].texture_size[0])
+                y1 = max(y1, self._fit_label(ylabels[k], text, sizes)[0])
             for k in range(len(ylabels)):
                 ylabels[k].pos = (
                     int(x_next) - ylabels[k].width + y1,
@@ -582,33 +748,28 @@ class Graph(Widget):
             else:
                 x_next += y1 + padding
         if len(xlabels) and xlabel_grid:
-            funcexp = exp10 if self.xlog else identity
-            funclog = log10 if self.xlog else identity
-            get_text = \
-                (lambda _k: self.x_grid_label(funcexp(xpoints[_k]))) if isinstance(self.x_grid_label, Callable) else \
-                self.x_grid_label.__getitem__ if isinstance(self.x_grid_label, (tuple, list, str)) else \
-                lambda _k: precision % funcexp(xpoints[_k])
+            get_text = self._tick_texts(
+                xpoints, self.xlog, self.x_grid_label).__getitem__
             # find the distance from the end that'll fit the last tick label
-            xlabels[0].text = get_text(-1)
-            xlabels[0].texture_update()
-            xextent = x + width - xlabels[0].texture_size[0] / 2. - padding
+            x1 = self._fit_label(xlabels[0], get_text(-1), sizes)
+            xextent = x + width - x1[0] / 2. - padding
             # find the distance from the start that'll fit the first tick label
             if not x_next:
-                xlabels[0].text = get_text(0)
-                xlabels[0].texture_update()
-                x_next = padding + xlabels[0].texture_size[0] / 2.
-            xmin = funclog(xmin)
-            ratio = (xextent - x_next) / float(funclog(self.xmax) - xmin)
+                x1 = self._fit_label(xlabels[0], get_text(0), sizes)
+                x_next = padding + x1[0] / 2.
+            xmax = self.xmax
+            if self.xlog:
+                xmin = log10(xmin)
+                xmax = log10(xmax)
+            ratio = (xextent - x_next) / float(xmax - xmin)
             right = -1
             for k in range(len(xlabels)):
                 try:
-                    xlabels[k].text = get_text(k)
+                    text = get_text(k)
                 except IndexError:
-                    pass
+                    text = xlabels[k].text
                 # update the size so we can center the labels on ticks
-                xlabels[k].texture_update()
-                xlabels[k].size = xlabels[k].texture_size
-                half_ts = xlabels[k].texture_size[0] / 2.
+                half_ts = self._fit_label(xlabels[k], text, sizes)[0] / 2.
                 xlabels[k].pos = (
                     int(x_next + (xpoints[k] - xmin) * ratio - half_ts),
                     int(y_next))
@@ -617,7 +778,7 @@ class Graph(Widget):
                     break
                 right = xlabels[k].right
             if not x_overlap:
-                y_next += padding + xlabels[0].texture_size[1]
+                y_next += padding + xlabels[0].height
         # now re-center the x and y axis labels
         if xlabel:
             xlabel.x = int(
@@ -634,35 +795,68 @@ class Graph(Widget):
                 ylabels[k].text = ''
         return x_next - x, y_next - y, xextent - x, yextent - y
 
+    def _tick_texts(self, points, log, grid_label):
+        """Returns the tick label texts of the major tick positions `points`,
+        as configured by `grid_label`, see :data:`x_grid_label`.
+        """
+        if isinstance(grid_label, (tuple, list, str)):
+            return grid_label
+        # the axis values of the ticks, they are stored in log scale
+        if np is not None:
+            values = np.asarray(points)
+            if log:
+                values = np.power(10., values)
+            values = values.tolist()
+        else:
+            values = [exp10(p) for p in points] if log else points
+        if isinstance(grid_label, Callable):
+            return [grid_label(v) for v in values]
+        precision = self.precision
+        return [precision % v for v in values]
+
+    @staticmethod
+    def _fit_label(label, text, sizes):
+        """Sets the text of the label and sizes it to its texture. The texture
+        size of each text is cached in the dict `sizes`, so the texture is
+        only rendered once per text and not at all if the text of the label
+        did not change since the last layout. Returns the size of the label.
+        """
+        label.text = text
+        size = sizes.get(text)
+        if size is None:
+            label.texture_update()
+            size = sizes[text] = tuple(label.texture_size)
+        label.size = size
+        return size
+
     def _update_ticks(self, size):
+        # nothing to do if neither the ticks nor their geometry changed, the
+        # ticks are reset by _redraw_all
+        key = (tuple(size), self.draw_border, self.x_grid, self.y_grid,
+               self.xlog, self.xmin, self.xmax, self.ylog, self.ymin,
+               self.ymax)
+        if key == self._ticks_key:
+            return
+        self._ticks_key = key
+        # the fbo keeps its content, so remove the old ticks
+        self._clear_buffer()
         # re-compute the positions of the bounding rectangle
         mesh = self._mesh_rect
-        vert = mesh.vertices
+        vert = self._rect_vertices
         if self.draw_border:
             s0, s1, s2, s3 = size
-            vert[0] = s0
-            vert[1] = s1
-            vert[4] = s2
-            vert[5] = s1
-            vert[8] = s2
-            vert[9] = s3
-            vert[12] = s0
-            vert[13] = s3
-            vert[16] = s0
-            vert[17] = s1
+            xs = (s0, s2, s2, s0, s0)
+            ys = (s1, s1, s3, s3, s1)
         else:
-            vert[0:18] = [0 for k in range(18)]
+            xs = ys = (0, 0, 0, 0, 0)
+        vert[0::4] = array('f', xs)
+        vert[1::4] = array('f', ys)
         mesh.vertices = vert
         # re-compute the positions of the x/y axis ticks
         mesh = self._mesh_ticks
-        vert = mesh.vertices
-        start = 0
-        xpoints = self._ticks_majorx
-        ypoints = self._ticks_majory
-        xpoints2 = self._ticks_minorx
-        ypoints2 = self._ticks_minory
-        ylog = self.ylog
+        vert = self._ticks_vertices
         xlog = self.xlog
+        ylog = self.ylog
         xmin = self.xmin
         xmax = self.xmax
         if xlog:
@@ -673,42 +867,49 @@ class Graph(Widget):
         if ylog:
             ymin = log10(ymin)
             ymax = log10(ymax)
-        if len(xpoints):
-            top = size[3] if self.x_grid else metrics.dp(12) + size[1]
-            ratio = (size[2] - size[0]) / float(xmax - xmin)
-            for k in range(start, len(xpoints) + start):
-                vert[k * 8] = size[0] + (xpoints[k - start] - xmin) * ratio
-                vert[k * 8 + 1] = size[1]
-                vert[k * 8 + 4] = vert[k * 8]
-                vert[k * 8 + 5] = top
-            start += len(xpoints)
-        if len(xpoints2):
-            top = metrics.dp(8) + size[1]
-            ratio = (size[2] - size[0]) / float(xmax - xmin)
-            for k in range(start, len(xpoints2) + start):
-                vert[k * 8] = size[0] + (xpoints2[k - start] - xmin) * ratio
-                vert[k * 8 + 1] = size[1]
-                vert[k * 8 + 4] = vert[k * 8]
-                vert[k * 8 + 5] = top
-            start += len(xpoints2)
-        if len(ypoints):
-            top = size[2] if self.y_grid else metrics.dp(12) + size[0]
-            ratio = (size[3] - size[1]) / float(ymax - ymin)
-            for k in range(start, len(ypoints) + start):
-                vert[k * 8 + 1] = size[1] + (ypoints[k - start] - ymin) * ratio
-                vert[k * 8 + 5] = vert[k * 8 + 1]
-                vert[k * 8] = size[0]
-                vert[k * 8 + 4] = top
-            start += len(ypoints)
-        if len(ypoints2):
-            top = metrics.dp(8) + size[0]
-            ratio = (size[3] - size[1]) / float(ymax - ymin)
-            for k in range(start, len(ypoints2) + start):
-                vert[k * 8 + 1] = size[1] + (
-                    ypoints2[k - start] - ymin) * ratio
-                vert[k * 8 + 5] = vert[k * 8 + 1]
-                vert[k * 8] = size[0]
-                vert[k * 8 + 4] = top
+        # each tick is a line of two vertices, (x, y, u, v) each. For the
+        # ticks of an axis, the position of the tick goes into the axis' own
+        # coordinate of both vertices, the other coordinate spans from the
+        # border of the plotting area to top
+        dp12 = metrics.dp(12)
+        dp8 = metrics.dp(8)
+        ticks = (
+            (self._ticks_majorx, 0, size[3] if self.x_grid else dp12 + size[1]),
+            (self._ticks_minorx, 0, dp8 + size[1]),
+            (self._ticks_majory, 1, size[2] if self.y_grid else dp12 + size[0]),
+            (self._ticks_minory, 1, dp8 + size[0]))
+        start = 0
+        for points, axis, top in ticks:
+            n = len(points)
+            if not n:
+                continue
+            if axis:
+                s_min = ymin
+                ratio = (size[3] - size[1]) / float(ymax - ymin)
+            else:
+                s_min = xmin
+                ratio = (size[2] - size[0]) / float(xmax - xmin)
+            other = 1 - axis
+            if np is not None:
+                rows = vert.reshape(-1, 8)[start:start + n]
+                # compute the positions in place in the vertex buffer. The
+                # subtraction is done in float64 before the cast to float32
+                # so large axis offsets don't lose precision
+                pos = rows[:, axis]
+                np.subtract(points, s_min, out=pos)
+                pos *= ratio
+                pos += size[axis]
+                rows[:, axis + 4] = pos
+                rows[:, other] = size[other]
+                rows[:, other + 4] = top
+            else:
+                for k in range(start, start + n):
+                    pos = size[axis] + (points[k - start] - s_min) * ratio
+                    vert[k * 8 + axis] = pos
+                    vert[k * 8 + axis + 4] = pos
+                    vert[k * 8 + other] = size[other]
+                    vert[k * 8 + other + 4] = top
+            start += n
         mesh.vertices = vert
 
     x_axis = ListProperty([None])
@@ -718,44 +919,46 @@ class Graph(Widget):
         if axis == 0:
             return self.xlog, self.xmin, self.xmax
         info = self.x_axis[axis]
-        return info["log"], info["min"], info["max"]
+        return info.log, info.min, info.max
 
     def get_y_axis(self, axis=0):
         if axis == 0:
             return self.ylog, self.ymin, self.ymax
         info = self.y_axis[axis]
-        return info["log"], info["min"], info["max"]
+        return info.log, info.min, info.max
 
     def add_x_axis(self, xmin, xmax, xlog=False):
-        data = {
-            "log": xlog,
-            "min": xmin,
-            "max": xmax
-        }
+        data = AxisInfo(xlog, xmin, xmax)
         self.x_axis.append(data)
         return data
 
     def add_y_axis(self, ymin, ymax, ylog=False):
-        data = {
-            "log": ylog,
-            "min": ymin,
-            "max": ymax
-        }
+        data = AxisInfo(ylog, ymin, ymax)
         self.y_axis.append(data)
         return data
 
     def _update_plots(self, size):
+        size = tuple(size)
         for plot in self.plots:
             xlog, xmin, xmax = self.get_x_axis(plot.x_axis)
             ylog, ymin, ymax = self.get_y_axis(plot.y_axis)
-            plot._update(xlog, xmin, xmax, ylog, ymin, ymax, size)
+            args = (xlog, xmin, xmax, ylog, ymin, ymax, size)
+            # the plot redraws itself when its points change, so it only
+            # needs an update if the axes or the plotting area changed
+            if args == plot._last_update_args:
+                continue
+            plot._last_update_args = args
+            plot._update(*args)
 
     def _update_colors(self, *args):
-        self._mesh_ticks_color.rgba = tuple(self.tick_color)
-        self._background_color.rgba = tuple(self.background_color)
-        self._mesh_rect_color.rgba = tuple(self.border_color)
+        # Color copies the values, so the lists can be passed directly
+        self._mesh_ticks_color.rgba = self.tick_color
+        self._background_color.rgba = self.background_color
+        self._mesh_rect_color.rgba = self.border_color
 
     def _redraw_all(self, *args):
+        # the label options may have changed, so measure the tick labels anew
+        self._tick_label_sizes = {}
         # add/remove all the required labels
         xpoints_major, xpoints_minor = self._redraw_x(*args)
         ypoints_major, ypoints_minor = self._redraw_y(*args)
@@ -764,17 +967,61 @@ class Graph(Widget):
             options = self.label_options.copy()
             options.update(**self.legend_label_options)
             for c in self._legend.children:
-                for k, v in options.items():
-                    setattr(c, k, v)
+                _apply_options(c, options)
 
         mesh = self._mesh_ticks
         n_points = (len(xpoints_major) + len(xpoints_minor) +
                     len(ypoints_major) + len(ypoints_minor))
-        mesh.vertices = [0] * (n_points * 8)
-        mesh.indices = [k for k in range(n_points * 2)]
+        # Mesh uses float32/uint16 buffers in place instead of converting
+        # lists. Every tick is a separate line, so no vertices are shared and
+        # the indices simply enumerate them. The buffers are only reallocated
+        # if they are too small, the vertices are written by _update_ticks
+        n_vertices = n_points * 2
+        if n_vertices > len(self._ticks_indices):
+            if np is not None:
+                self._ticks_buffer = np.zeros(
+                    n_vertices * 4, dtype=np.float32)
+                self._ticks_indices = np.arange(n_vertices, dtype=np.uint16)
+            else:
+                self._ticks_buffer = array('f', [0]) * (n_vertices * 4)
+                self._ticks_indices = array('H', range(n_vertices))
+        if len(self._ticks_vertices) != n_vertices * 4:
+            if np is not None:
+                vertices = self._ticks_buffer[:n_vertices * 4]
+                indices = self._ticks_indices[:n_vertices]
+            else:
+                vertices = memoryview(self._ticks_buffer)[:n_vertices * 4]
+                indices = memoryview(self._ticks_indices)[:n_vertices]
+            self._ticks_vertices = vertices
+            mesh.vertices = vertices
+            mesh.indices = indices
+        self._ticks_key = None
         self._redraw_size()
 
+    def _get_tick_label_options(self):
+        # the label options of the tick labels, which are shared by both axes
+        # and cached until label_options or tick_label_options change
+        options = self._tick_label_options
+        if options is None:
+            options = self.label_options.copy()
+            options.update(**self.tick_label_options)
+            self._tick_label_options = options
+        return options
+
+    def _reset_tick_label_options(self, *largs):
+        self._tick_label_options = None
+
     def _redraw_x(self, *args):
+        # the label and ticks only depend on these values, so there is nothing
+        # to do if none of them changed since the last call
+        key = (self.xlabel, dict(self.label_options),
+               dict(self.tick_label_options), _frozen(self.x_ticks_major),
+               _frozen(self.x_ticks_minor), self.xlog, self.xmin, self.xmax,
+               _frozen(self.x_grid_label), self.x_ticks_angle)
+        if key == self._redraw_x_key:
+            return self._ticks_majorx, self._ticks_minorx
+        self._redraw_x_key = key
+
         if self.xlabel:
             xlabel = self._xlabel
             if not xlabel:
@@ -782,8 +1029,7 @@ class Graph(Widget):
                 self.add_widget(xlabel)
                 self._xlabel = xlabel
 
-            for k, v in self.label_options.items():
-                setattr(xlabel, k, v)
+            _apply_options(xlabel, self.label_options)
 
         else:
             xlabel = self._xlabel
@@ -795,8 +1041,8 @@ class Graph(Widget):
                                                        self.x_ticks_minor,
                                                        self.xlog, self.xmin,
                                                        self.xmax)
-        self._ticks_majorx = xpoints_major
-        self._ticks_minorx = xpoints_minor
+        self._ticks_majorx = array('d', xpoints_major)
+        self._ticks_minorx = array('d', xpoints_minor)
 
         if not self.x_grid_label:
             n_labels = 0
@@ -805,22 +1051,43 @@ class Graph(Widget):
         else:
             n_labels = len(xpoints_major)
 
-        for k in range(n_labels, len(grids)):
-            self.remove_widget(grids[k])
+        # unused labels are hidden and kept for reuse, instead of removing
+        # and adding widgets whenever the number of ticks changes
+        pool = self._x_grid_label_pool
+        for label in grids[n_labels:]:
+            label.text = ''
+            label.opacity = 0
+            pool.append(label)
         del grids[n_labels:]
 
         grid_len = len(grids)
         grids.extend([None] * (n_labels - len(grids)))
-        options = self.label_options.copy()
-        options.update(**self.tick_label_options)
+        options = self._get_tick_label_options()
+        for k in range(grid_len):
+            _apply_options(grids[k], options)
         for k in range(grid_len, n_labels):
-            grids[k] = GraphRotatedLabel(
-                angle=self.x_ticks_angle,
-                **options)
-            self.add_widget(grids[k])
+            if pool:
+                label = pool.pop()
+                label.opacity = 1
+                label.angle = self.x_ticks_angle
+                _apply_options(label, options)
+            else:
+                label = GraphRotatedLabel(angle=self.x_ticks_angle, **options)
+                label._applied_options = dict(options)
+                self.add_widget(label)
+            grids[k] = label
         return xpoints_major, xpoints_minor
 
     def _redraw_y(self, *args):
+        # see _redraw_x
+        key = (self.ylabel, dict(self.label_options),
+               dict(self.tick_label_options), _frozen(self.y_ticks_major),
+               _frozen(self.y_ticks_minor), self.ylog, self.ymin, self.ymax,
+               _frozen(self.y_grid_label))
+        if key == self._redraw_y_key:
+            return self._ticks_majory, self._ticks_minory
+        self._redraw_y_key = key
+
         if self.ylabel:
             ylabel = self._ylabel
             if not ylabel:
@@ -828,8 +1095,7 @@ class Graph(Widget):
                 self.add_widget(ylabel)
                 self._ylabel = ylabel
 
-            for k, v in self.label_options.items():
-                setattr(ylabel, k, v)
+            _apply_options(ylabel, self.label_options)
         else:
             ylabel = self._ylabel
             if ylabel:
@@ -840,8 +1106,8 @@ class Graph(Widget):
                                                        self.y_ticks_minor,
                                                        self.ylog, self.ymin,
                                                        self.ymax)
-        self._ticks_majory = ypoints_major
-        self._ticks_minory = ypoints_minor
+        self._ticks_majory = array('d', ypoints_major)
+        self._ticks_minory = array('d', ypoints_minor)
 
         if not self.y_grid_label:
             n_labels = 0
@@ -850,37 +1116,55 @@ class Graph(Widget):
         else:
             n_labels = len(ypoints_major)
 
-        for k in range(n_labels, len(grids)):
-            self.remove_widget(grids[k])
+        # see _redraw_x
+        pool = self._y_grid_label_pool
+        for label in grids[n_labels:]:
+            label.text = ''
+            label.opacity = 0
+            pool.append(label)
         del grids[n_labels:]
 
         grid_len = len(grids)
         grids.extend([None] * (n_labels - len(grids)))
-        options = self.label_options.copy()
-        options.update(**self.tick_label_options)
+        options = self._get_tick_label_options()
+        for k in range(grid_len):
+            _apply_options(grids[k], options)
         for k in range(grid_len, n_labels):
-            grids[k] = Label(**options)
-            self.add_widget(grids[k])
+            if pool:
+                label = pool.pop()
+                label.opacity = 1
+                _apply_options(label, options)
+            else:
+                label = Label(**options)
+                label._applied_options = dict(options)
+                self.add_widget(label)
+            grids[k] = label
         return ypoints_major, ypoints_minor
 
     def _redraw_size(self, *args):
         # size a 4-tuple describing the bounding box in which we can draw
         # graphs, it's (x0, y0, x1, y1), which correspond with the bottom left
         # and top right corner locations, respectively
-        self._clear_buffer()
         size = self._update_labels()
-        self.view_pos = self._plot_area.pos = (size[0], size[1])
-        self.view_size = self._plot_area.size = (
-            size[2] - size[0], size[3] - size[1])
-
-        if self.size[0] and self.size[1]:
-            self._fbo.size = self.size
-        else:
-            self._fbo.size = 1, 1  # gl errors otherwise
-        self._fbo_rect.texture = self._fbo.texture
-        self._fbo_rect.size = self.size
+        # the fbo and plotting area only need to be updated if the plotting
+        # area or the graph size changed. The buffer is cleared by
+        # _update_ticks if it redraws the ticks, and by plots that redraw
+        view = (tuple(size), tuple(self.size))
+        if view != self._view_key:
+            self._view_key = view
+            self._ticks_key = None
+            self.view_pos = self._plot_area.pos = (size[0], size[1])
+            self.view_size = self._plot_area.size = (
+                size[2] - size[0], size[3] - size[1])
+
+            if self.size[0] and self.size[1]:
+                self._fbo.size = self.size
+            else:
+                self._fbo.size = 1, 1  # gl errors otherwise
+            self._fbo_rect.texture = self._fbo.texture
+            self._fbo_rect.size = self.size
+            self._background_rect.size = self.size
         self._fbo_rect.pos = self.pos
-        self._background_rect.size = self.size
         self._update_ticks(size)
         self._update_plots(size)
 
@@ -889,26 +1173,53 @@ class Graph(Widget):
             self.legend.size = self.legend.minimum_size
             pos, size = self.view_pos, self.view_size
             ph = self.legend.pos_hint
-            if 'x' in ph or 'center_x' in ph or 'right' in ph:
-                x = size[0] * (ph.get('x', ph.get('center_x', ph.get('right')))) \
-                    - (self.legend.width * (0 if 'x' in ph else .5 if 'center_x' in ph else 1)) \
-                    - (self.padding * (-1 if 'x' in ph else 0 if 'center_x' in ph else 1))
+            # the hinted fraction of the plotting area, and the fractions of
+            # the legend size and of the padding to subtract from it
+            anchor = None
+            if 'x' in ph:
+                anchor = ph['x'], 0, -1
+            elif 'center_x' in ph:
+                anchor = ph['center_x'], .5, 0
+            elif 'right' in ph:
+                anchor = ph['right'], 1, 1
+            if anchor is not None:
+                frac, wmul, pmul = anchor
+                x = size[0] * frac - self.legend.width * wmul \
+                    - self.padding * pmul
                 self.legend.x = self.x + pos[0] + x
-            if 'y' in ph or 'center_y' in ph or 'top' in ph:
-                y = size[1] * (ph.get('y', ph.get('center_y', ph.get('top')))) \
-                    - (self.legend.height * (0 if 'y' in ph else .5 if 'center_y' in ph else 1)) \
-                    - (self.padding * (-1 if 'y' in ph else 0 if 'center_y' in ph else 1))
+            anchor = None
+            if 'y' in ph:
+                anchor = ph['y'], 0, -1
+            elif 'center_y' in ph:
+                anchor = ph['center_y'], .5, 0
+            elif 'top' in ph:
+                anchor = ph['top'], 1, 1
+            if anchor is not None:
+                frac, hmul, pmul = anchor
+                y = size[1] * frac - self.legend.height * hmul \
+                    - self.padding * pmul
                 self.legend.y = self.y + pos[1] + y
+            # the markers only need to be redrawn if they moved or resized
+            legend = self.legend
+            children = legend.children
+            sig = (tuple(self._legend_plots), legend.spacing,
+                   tuple(legend.marker_size),
+                   tuple((c.x, c.center_y) for c in children))
+            if sig == self._legend_sig:
+                return
+            self._legend_sig = sig
             for i, plot in enumerate(self._legend_plots):
-                label = self.legend.children[-(i+1)]
-                drawing_center = label.x - self.legend.spacing - self.legend.marker_width / 2, label.center_y
-                plot.draw_legend(drawing_center, self.legend.marker_size)
+                label = children[-(i+1)]
+                drawing_center = label.x - legend.spacing - legend.marker_width / 2, label.center_y
+                plot.draw_legend(drawing_center, legend.marker_size)
 
     def _clear_buffer(self, *largs):
         fbo = self._fbo
         fbo.bind()
         fbo.clear_buffer()
         fbo.release()
+        # redraw the instructions, even if none of them changes
+        fbo.ask_update()
 
     def add_plot(self, plot):
         '''Add a new plot to this graph.
@@ -924,9 +1235,13 @@ class Graph(Widget):
         '''
         if plot in self.plots:
             return
-        add = self._plot_area.canvas.add
+        # add the drawings to the canvas at once in a group, which is also
+        # removed at once by remove_plot
+        group = InstructionGroup()
         for instr in plot.get_drawings():
-            add(instr)
+            group.add(instr)
+        self._plot_area.canvas.add(group)
+        self._plot_groups[plot] = group
         plot.bind(on_clear_plot=self._clear_buffer)
         self.plots.append(plot)
 
@@ -945,9 +1260,9 @@ class Graph(Widget):
         '''
         if plot not in self.plots:
             return
-        remove = self._plot_area.canvas.remove
-        for instr in plot.get_drawings():
-            remove(instr)
+        group = self._plot_groups.pop(plot, None)
+        if group is not None:
+            self._plot_area.canvas.remove(group)
         plot.unbind(on_clear_plot=self._clear_buffer)
         self.plots.remove(plot)
         self._clear_buffer()
@@ -978,21 +1293,35 @@ class Graph(Widget):
 
         If the graph has multiple axes, use :class:`Plot.unproject` instead.
         '''
-        adj_x = float(x - self._plot_area.pos[0])
-        adj_y = float(y - self._plot_area.pos[1])
-        norm_x = adj_x / self._plot_area.size[0]
-        norm_y = adj_y / self._plot_area.size[1]
+        params = self._to_data_params
+        if params is None:
+            params = self._to_data_params = self._get_to_data_params()
+        x0, y0, ratiox, ratioy, xmin, ymin, xlog, ylog = params
+        conv_x = (x - x0) * ratiox + xmin
+        if xlog:
+            conv_x = 10. ** conv_x
+        conv_y = (y - y0) * ratioy + ymin
+        if ylog:
+            conv_y = 10. ** conv_y
+        return [conv_x, conv_y]
+
+    def _get_to_data_params(self):
+        # the origin of the plotting area, the data units per pixel and the
+        # axis minima, in log scale for log axes, used by to_data
+        x0, y0 = self._plot_area.pos
+        width, height = self._plot_area.size
+        xmin, xmax = self.xmin, self.xmax
         if self.xlog:
-            xmin, xmax = log10(self.xmin), log10(self.xmax)
-            conv_x = 10.**(norm_x * (xmax - xmin) + xmin)
-        else:
-            conv_x = norm_x * (self.xmax - self.xmin) + self.xmin
+            xmin, xmax = log10(xmin), log10(xmax)
+        ymin, ymax = self.ymin, self.ymax
         if self.ylog:
-            ymin, ymax = log10(self.ymin), log10(self.ymax)
-            conv_y = 10.**(norm_y * (ymax - ymin) + ymin)
-        else:
-            conv_y = norm_y * (self.ymax - self.ymin) + self.ymin
-        return [conv_x, conv_y]
+            ymin, ymax = log10(ymin), log10(ymax)
+        return (float(x0), float(y0), (xmax - xmin) / float(width),
+                (ymax - ymin) / float(height), xmin, ymin, self.xlog,
+                self.ylog)
+
+    def _reset_to_data_params(self, *largs):
+        self._to_data_params = None
 
     xmin = NumericProperty(0.)
     '''The x-axis minimum value.
@@ -1280,7 +1609,15 @@ class Plot(EventDispatcher):
     def __init__(self, **kwargs):
         super(Plot, self).__init__(**kwargs)
         self.ask_draw = Clock.create_trigger(self.draw)
+        self._x_px = self._y_px = self._px_params_cache = None
+        self.bind(params=self._reset_px)
         self.bind(params=self.ask_draw, points=self.ask_draw)
+        # the arguments of the last update by the graph
+        self._last_update_args = None
+        # buffer of _flat_px_points, grown as needed
+        self._flat_buf = None
+        # vertices and indices of _mesh_buffer, grown as needed
+        self._mesh_buf = self._mesh_indices = None
         self._drawings = self.create_drawings()
 
     def funcx(self):
@@ -1298,6 +1635,8 @@ class Plot(EventDispatcher):
         pixel coordinate on the plot, according to the plot settings and axis
         settings. It's relative to the graph pos.
         """
+        if self._x_px is not None:
+            return self._x_px
         funcx = self.funcx()
         params = self.params
         size = params["size"]
@@ -1308,13 +1647,16 @@ class Plot(EventDispatcher):
         if xrange:
             ratiox = (size[2] - size[0]) / xrange
 
-        return lambda x: (funcx(x) - xmin) * ratiox + size[0]
+        self._x_px = lambda x: (funcx(x) - xmin) * ratiox + size[0]
+        return self._x_px
 
     def y_px(self):
         """Return a function that convert the Y value of the graph to the
         pixel coordinate on the plot, according to the plot settings and axis
         settings. The returned value is relative to the graph pos.
         """
+        if self._y_px is not None:
+            return self._y_px
         funcy = self.funcy()
         params = self.params
         size = params["size"]
@@ -1325,7 +1667,12 @@ class Plot(EventDispatcher):
         if yrange:
             ratioy = (size[3] - size[1]) / yrange
 
-        return lambda y: (funcy(y) - ymin) * ratioy + size[1]
+        self._y_px = lambda y: (funcy(y) - ymin) * ratioy + size[1]
+        return self._y_px
+
+    def _reset_px(self, *largs):
+        # the conversions to pixels are cached until the params change
+        self._x_px = self._y_px = self._px_params_cache = None
 
     def unproject(self, x, y):
         """Return a function that unproject a pixel to a X/Y value on the plot
@@ -1368,6 +1715,24 @@ class Plot(EventDispatcher):
             "ymax": y_px(params["ymax"]),
         }
 
+    def get_x_affine(self):
+        """Returns the tuple (scale, offset) of the conversion of :meth:`x_px`,
+        so that the pixel coordinate of X value ``x`` is
+        ``x * scale + offset``. For a log axis, ``x`` is ``log10`` of the
+        value.
+        """
+        _, xmin, ratiox, x0 = self._px_params()[:4]
+        return ratiox, x0 - xmin * ratiox
+
+    def get_y_affine(self):
+        """Returns the tuple (scale, offset) of the conversion of :meth:`y_px`,
+        so that the pixel coordinate of Y value ``y`` is
+        ``y * scale + offset``. For a log axis, ``y`` is ``log10`` of the
+        value.
+        """
+        _, ymin, ratioy, y0 = self._px_params()[4:]
+        return ratioy, y0 - ymin * ratioy
+
     def update(self, xlog, xmin, xmax, ylog, ymin, ymax, size):
         '''Called by graph whenever any of the parameters
         change. The plot should be recalculated then.
@@ -1376,9 +1741,15 @@ class Plot(EventDispatcher):
         graphs, it's (x0, y0, x1, y1), which correspond with the bottom left
         and top right corner locations, respectively.
         '''
-        self.params.update({
+        values = {
             'xlog': xlog, 'xmin': xmin, 'xmax': xmax, 'ylog': ylog,
-            'ymin': ymin, 'ymax': ymax, 'size': size})
+            'ymin': ymin, 'ymax': ymax, 'size': size}
+        # updating params dispatches, and redraws the plot, even if none of
+        # the values changed
+        params = self.params
+        if all(k in params and params[k] == v for k, v in values.items()):
+            return
+        params.update(values)
 
     def get_group(self):
         '''returns a string which is unique and is the group name given to all
@@ -1420,10 +1791,97 @@ class Plot(EventDispatcher):
     def iterate_points(self):
         '''Iterate on all the points adjusted to the graph settings
         '''
-        x_px = self.x_px()
-        y_px = self.y_px()
-        for x, y in self.points:
-            yield x_px(x), y_px(y)
+        xlog, xmin, ratiox, x0, ylog, ymin, ratioy, y0 = self._px_params()
+        if not xlog and not ylog:
+            return (((x - xmin) * ratiox + x0, (y - ymin) * ratioy + y0)
+                    for x, y in self.points)
+        funcx = log10 if xlog else identity
+        funcy = log10 if ylog else identity
+        return (((funcx(x) - xmin) * ratiox + x0,
+                 (funcy(y) - ymin) * ratioy + y0) for x, y in self.points)
+
+    def _px_params(self):
+        """Return the parameters of :meth:`x_px` and :meth:`y_px` as the tuple
+        (xlog, xmin, ratiox, x0, ylog, ymin, ratioy, y0), so that the
+        conversion can be inlined. The minima are in log scale for log axes.
+        """
+        if self._px_params_cache is not None:
+            return self._px_params_cache
+        params = self.params
+        size = params["size"]
+        xlog = params["xlog"]
+        xmin = params["xmin"]
+        xmax = params["xmax"]
+        if xlog:
+            xmin = log10(xmin)
+            xmax = log10(xmax)
+        ylog = params["ylog"]
+        ymin = params["ymin"]
+        ymax = params["ymax"]
+        if ylog:
+            ymin = log10(ymin)
+            ymax = log10(ymax)
+        ratiox = ratioy = 0
+        if xmax != xmin:
+            ratiox = (size[2] - size[0]) / float(xmax - xmin)
+        if ymax != ymin:
+            ratioy = (size[3] - size[1]) / float(ymax - ymin)
+        self._px_params_cache = (
+            xlog, xmin, ratiox, size[0], ylog, ymin, ratioy, size[1])
+        return self._px_params_cache
+
+    def _px_arrays(self):
+        """Return the pixel coordinates of all the points as two float numpy
+        arrays, x and y. This is the vectorized :meth:`iterate_points` and
+        requires numpy.
+        """
+        xlog, xmin, ratiox, x0, ylog, ymin, ratioy, y0 = self._px_params()
+        points = np.asarray(self.points, dtype=np.float64).reshape(-1, 2)
+        xs = points[:, 0]
+        ys = points[:, 1]
+        if xlog:
+            xs = np.log10(xs)
+        if ylog:
+            ys = np.log10(ys)
+        return (xs - xmin) * ratiox + x0, (ys - ymin) * ratioy + y0
+
+    def _flat_px_points(self):
+        """Return the pixel coordinates of all the points as a flat list,
+        [x0, y0, x1, y1, ...], as used by e.g. :class:`~kivy.graphics.Line`.
+        """
+        if np is None:
+            return [v for p in self.iterate_points() for v in p]
+        xs, ys = self._px_arrays()
+        n = 2 * len(xs)
+        if self._flat_buf is None or len(self._flat_buf) < n:
+            self._flat_buf = np.empty(n)
+        flat = self._flat_buf[:n]
+        flat[0::2] = xs
+        flat[1::2] = ys
+        return flat.tolist()
+
+    def _mesh_buffer(self, size):
+        """Return a float32 numpy array for the x, y, u, v of `size` mesh
+        vertices. The array is kept between draws and only the x and y
+        coordinates are written by the plots, so u and v remain 0. Requires
+        numpy.
+        """
+        buf = self._mesh_buf
+        if buf is None or len(buf) < 4 * size:
+            buf = self._mesh_buf = np.zeros(4 * size, dtype=np.float32)
+            self._mesh_indices = np.arange(size, dtype=np.uint16)
+        return buf[:4 * size]
+
+    def _upload_mesh(self, mesh, size):
+        """Set the first `size` vertices of :meth:`_mesh_buffer` as the
+        vertices of `mesh`, with the indices 0 to `size` - 1.
+        """
+        if not size:
+            mesh.indices = []
+            mesh.vertices = []
+            return
+        mesh.indices = self._mesh_indices[:size]
+        mesh.vertices = self._mesh_buf[:4 * size]
 
     def on_clear_plot(self, *largs):
         pass
@@ -1453,6 +1911,11 @@ class MeshLinePlot(Plot):
     Defaults to 'line_strip'.
     '''
 
+    # indices of the legend mesh vertices of draw_legend, by mode. The other
+    # modes use a triangle of three vertices
+    _legend_indices = {'line_strip': (0, 1), 'points': (0, 1, 2, 3, 4),
+                       'lines': (0, 1, 2, 3)}
+
     def create_drawings(self):
         self._color = Color(*self.color)
         self._mesh = Mesh(mode='line_strip')
@@ -1469,19 +1932,27 @@ class MeshLinePlot(Plot):
         self._legend_maximum_size = maximum_size = maximum_size or self._legend_maximum_size
         x, right = center[0] - .5 * maximum_size[0], center[0] + .5 * maximum_size[0]
         y, top = center[1] - .5 * maximum_size[1], center[1] + .5 * maximum_size[1]
+        mode = self.mode
         self._mesh_legend.vertices = \
-            [x, center[1], 0, 0, right, center[1], 0, 0] if self.mode == 'line_strip' else \
+            [x, center[1], 0, 0, right, center[1], 0, 0] if mode == 'line_strip' else \
             [x, y, 0, 0, x, top, 0, 0, right, top, 0, 0, right, y, 0, 0,
-             center[0], center[1], 0, 0] if self.mode == "points" else \
-            [x, y, 0, 0, center[0], top, 0, 0, center[0], y, 0, 0, right, top, 0, 0] if self.mode == "lines" else \
+             center[0], center[1], 0, 0] if mode == "points" else \
+            [x, y, 0, 0, center[0], top, 0, 0, center[0], y, 0, 0, right, top, 0, 0] if mode == "lines" else \
             [x, y, 0, 0, center[0], top, 0, 0, right, y, 0, 0]
-        self._mesh_legend.indices = tuple(range(len(self._mesh_legend.vertices) // 4))
+        self._mesh_legend.indices = self._legend_indices.get(mode, (0, 1, 2))
 
     def draw(self, *args):
         super(MeshLinePlot, self).draw(*args)
         self.plot_mesh()
 
     def plot_mesh(self):
+        if np is not None:
+            xs, ys = self._px_arrays()
+            vert = self._mesh_buffer(len(xs))
+            vert[0::4] = xs
+            vert[1::4] = ys
+            self._upload_mesh(self._mesh, len(xs))
+            return
         points = [p for p in self.iterate_points()]
         mesh, vert, _ = self.set_mesh_size(len(points))
         for k, (x, y) in enumerate(points):
@@ -1491,8 +1962,13 @@ class MeshLinePlot(Plot):
 
     def set_mesh_size(self, size):
         mesh = self._mesh
+        # the numpy paths set arrays from _mesh_buffer, which can't be resized
         vert = mesh.vertices
+        if not isinstance(vert, list):
+            vert = list(vert)
         ind = mesh.indices
+        if not isinstance(ind, list):
+            ind = list(ind)
         diff = size - len(vert) // 4
         if diff < 0:
             del vert[4 * size:]
@@ -1500,6 +1976,7 @@ class MeshLinePlot(Plot):
         elif diff > 0:
             ind.extend(range(len(ind), len(ind) + diff))
             vert.extend([0] * (diff * 4))
+        mesh.indices = ind
         mesh.vertices = vert
         return mesh, vert, ind
 
@@ -1510,10 +1987,19 @@ class MeshStemPlot(MeshLinePlot):
     '''
 
     def plot_mesh(self):
+        y0 = self.y_px()(0)
+        if np is not None:
+            xs, ys = self._px_arrays()
+            vert = self._mesh_buffer(len(xs) * 2)
+            vert[0::8] = xs
+            vert[1::8] = y0
+            vert[4::8] = xs
+            vert[5::8] = ys
+            self._upload_mesh(self._mesh, len(xs) * 2)
+            return
         points = [p for p in self.iterate_points()]
         mesh, vert, _ = self.set_mesh_size(len(points) * 2)
-        y0 = self.y_px()(0)
-        for k, (x, y) in enumerate(self.iterate_points()):
+        for k, (x, y) in enumerate(points):
             vert[k * 8] = x
             vert[k * 8 + 1] = y0
             vert[k * 8 + 4] = x
@@ -1543,11 +2029,7 @@ class LinePlot(Plot):
 
     def draw(self, *args):
         super(LinePlot, self).draw(*args)
-        # flatten the list
-        points = []
-        for x, y in self.iterate_points():
-            points += [x, y]
-        self._gline.points = points
+        self._gline.points = self._flat_px_points()
 
     def create_legend_drawings(self):
         from kivy.graphics import Line, RenderContext
@@ -1604,16 +2086,12 @@ class SmoothLinePlot(Plot):
         b"{{{sssjjjbbbZZZRRRJJJAAA999111)))   \x18\x18\x18\x10\x10\x10"
         b"\x08\x08\x08\x00\x00\x00")
 
+    # the gradient texture of the shader, shared by all instances
+    _texture = None
+
     def create_drawings(self):
         from kivy.graphics import Line, RenderContext
 
-        # very first time, create a texture for the shader
-        if not hasattr(SmoothLinePlot, '_texture'):
-            tex = Texture.create(size=(1, 64), colorfmt='rgb')
-            tex.add_reload_observer(SmoothLinePlot._smooth_reload_observer)
-            SmoothLinePlot._texture = tex
-            SmoothLinePlot._smooth_reload_observer(tex)
-
         self._grc = RenderContext(
             fs=SmoothLinePlot.SMOOTH_FS,
             use_parent_modelview=True,
@@ -1622,21 +2100,29 @@ class SmoothLinePlot(Plot):
             self._gcolor = Color(*self.color)
             self._gline = Line(
                 points=[], cap='none', width=2.,
-                texture=SmoothLinePlot._texture)
+                texture=SmoothLinePlot._get_texture())
 
         return [self._grc]
 
+    @staticmethod
+    def _get_texture():
+        # very first time, create a texture for the shader
+        texture = SmoothLinePlot._texture
+        if texture is None:
+            texture = Texture.create(size=(1, 64), colorfmt='rgb')
+            texture.add_reload_observer(
+                SmoothLinePlot._smooth_reload_observer)
+            SmoothLinePlot._smooth_reload_observer(texture)
+            SmoothLinePlot._texture = texture
+        return texture
+
     @staticmethod
     def _smooth_reload_observer(texture):
         texture.blit_buffer(SmoothLinePlot.GRADIENT_DATA, colorfmt="rgb")
 
     def draw(self, *args):
         super(SmoothLinePlot, self).draw(*args)
-        # flatten the list
-        points = []
-        for x, y in self.iterate_points():
-            points += [x, y]
-        self._gline.points = points
+        self._gline.points = self._flat_px_points()
 
     def create_legend_drawings(self):
         return LinePlot.create_legend_drawings(self)
@@ -1663,10 +2149,20 @@ class ContourPlot(Plot):
     xrange = ListProperty([0, 100])
     yrange = ListProperty([0, 100])
 
+    _scaled_buf = None
+
+    _pixel_buf = None
+
+    _texture = None
+
     def __init__(self, **kwargs):
         super(ContourPlot, self).__init__(**kwargs)
-        self.bind(data=self.ask_draw, xrange=self.ask_draw,
-                  yrange=self.ask_draw)
+        # when only the placement of the image changes, the texture is kept
+        self.unbind(params=self.ask_draw)
+        self.ask_place = Clock.create_trigger(self.place_image)
+        self.bind(params=self.ask_place, xrange=self.ask_place,
+                  yrange=self.ask_place)
+        self.bind(data=self.ask_draw)
 
     def create_drawings(self):
         self._image = Rectangle()
@@ -1677,38 +2173,63 @@ class ContourPlot(Plot):
 
     def draw(self, *args):
         super(ContourPlot, self).draw(*args)
-        data = self.data
-        xdim, ydim = data.shape
+        self._update_texture()
+        self._place_image()
 
-        # Find the minimum and maximum z values
-        zmax = data.max()
-        zmin = data.min()
-        rgb_scale_factor = 1.0 / (zmax - zmin) * 255
-        # Scale the z values into RGB data
-        buf = np.array(data, dtype=float, copy=True)
-        np.subtract(buf, zmin, out=buf)
-        np.multiply(buf, rgb_scale_factor, out=buf)
-        # Duplicate into 3 dimensions (RGB) and convert to byte array
-        buf = np.asarray(buf, dtype=np.uint8)
-        buf = np.expand_dims(buf, axis=2)
-        buf = np.concatenate((buf, buf, buf), axis=2)
-        buf = np.reshape(buf, (xdim, ydim, 3))
-
-        charbuf = bytearray(np.reshape(buf, (buf.size)))
-        self._texture = Texture.create(size=(xdim, ydim), colorfmt='rgb')
-        self._texture.blit_buffer(charbuf, colorfmt='rgb', bufferfmt='ubyte')
-        image = self._image
-        image.texture = self._texture
+    def place_image(self, *args):
+        '''Only updates the position and size of the image, according to the
+        params, :attr:`xrange` and :attr:`yrange`. It dispatches
+        on_clear_plot like :meth:`draw`.
+        '''
+        if self._texture is None:
+            # nothing was drawn yet
+            self.draw(*args)
+            return
+        super(ContourPlot, self).draw(*args)
+        self._place_image()
 
+    def _place_image(self):
         x_px = self.x_px()
         y_px = self.y_px()
         bl = x_px(self.xrange[0]), y_px(self.yrange[0])
         tr = x_px(self.xrange[1]), y_px(self.yrange[1])
+        image = self._image
         image.pos = bl
         w = tr[0] - bl[0]
         h = tr[1] - bl[1]
         image.size = (w, h)
 
+    def _update_texture(self):
+        data = self.data
+        xdim, ydim = data.shape
+
+        # Find the minimum and maximum z values
+        zmax = data.max()
+        zmin = data.min()
+        scale_factor = 1.0 / (zmax - zmin) * 255
+        # the buffers are kept between draws as long as the shape is the same
+        if self._scaled_buf is None or self._scaled_buf.shape != data.shape:
+            self._scaled_buf = np.empty((xdim, ydim), dtype=np.float32)
+            self._pixel_buf = np.empty((xdim, ydim), dtype=np.uint8)
+        # Scale the z values into intensity data, converting to bytes as the
+        # scaled values are stored. The offset values are only stored as
+        # float32, which is plenty for 256 levels and halves the memory traffic
+        buf = self._scaled_buf
+        pixels = self._pixel_buf
+        np.subtract(data, zmin, out=buf, dtype=float, casting='same_kind')
+        np.multiply(buf, scale_factor, out=pixels, casting='unsafe')
+
+        image = self._image
+        # the texture is only recreated if the size of the data changed
+        texture = self._texture
+        if texture is None or tuple(texture.size) != (xdim, ydim):
+            texture = self._texture = Texture.create(
+                size=(xdim, ydim), colorfmt='luminance')
+            image.texture = texture
+        # blit_buffer takes a flat buffer, the reshape is a view of pixels
+        texture.blit_buffer(
+            pixels.reshape(-1), colorfmt='luminance', bufferfmt='ubyte')
+
 
 class BarPlot(Plot):
     '''BarPlot class which displays a bar graph.
@@ -1722,9 +2243,15 @@ class BarPlot(Plot):
         super(BarPlot, self).__init__(*ar, **kw)
         self.bind(bar_width=self.ask_draw)
         self.bind(bar_width=lambda *_: self.draw_legend())
-        self.bind(points=self.update_bar_width)
+        # the smallest and largest x of the points, computed when needed
+        self._x_range = None
+        self.bind(points=self._on_points)
         self.bind(graph=self.update_bar_width)
 
+    def _on_points(self, *ar):
+        self._x_range = None
+        self.update_bar_width()
+
     def update_bar_width(self, *ar):
         if not self.graph:
             return
@@ -1733,10 +2260,14 @@ class BarPlot(Plot):
         if self.graph.xmax == self.graph.xmin:
             return
 
+        if self._x_range is None:
+            xs = [p[0] for p in self.points]
+            self._x_range = min(xs), max(xs)
+        xmin, xmax = self._x_range
         point_width = (
             len(self.points) *
             float(abs(self.graph.xmax) + abs(self.graph.xmin)) /
-            float(abs(max(self.points)[0]) + abs(min(self.points)[0])))
+            float(abs(xmax) + abs(xmin)))
 
         if not self.points:
             self.bar_width = 1
@@ -1786,15 +2317,6 @@ class BarPlot(Plot):
         point_len = len(points)
         mesh = self._mesh
         mesh.mode = 'triangles'
-        vert = mesh.vertices
-        ind = mesh.indices
-        diff = len(points) * 6 - len(vert) // 4
-        if diff < 0:
-            del vert[24 * point_len:]
-            del ind[point_len:]
-        elif diff > 0:
-            ind.extend(range(len(ind), len(ind) + diff))
-            vert.extend([0] * (diff * 4))
 
         bounds = self.get_px_bounds()
         x_px = self.x_px()
@@ -1805,12 +2327,46 @@ class BarPlot(Plot):
         if bar_width < 0:
             bar_width = x_px(bar_width) - bounds["xmin"]
 
+        if np is not None:
+            # fill each vertex column of all the bars at once
+            xs, ys = self._px_arrays()
+            x1 = xs[:point_len]
+            x2 = x1 + bar_width
+            y1 = ymin
+            y2 = ys[:point_len]
+            vert = self._mesh_buffer(point_len * 6)
+            for idx, values in (
+                    (0, x1), (1, y2), (4, x1), (5, y1), (8, x2), (9, y1),
+                    (12, x1), (13, y2), (16, x2), (17, y2), (20, x2),
+                    (21, y1)):
+                vert[idx::24] = values
+            self._upload_mesh(mesh, point_len * 6)
+            return
+
+        vert = mesh.vertices
+        ind = mesh.indices
+        diff = len(points) * 6 - len(vert) // 4
+        if diff < 0:
+            del vert[24 * point_len:]
+            del ind[6 * point_len:]
+        elif diff > 0:
+            ind.extend(range(len(ind), len(ind) + diff))
+            vert.extend([0] * (diff * 4))
+
+        xlog = self.params["xlog"]
+        ylog = self.params["ylog"]
+        xscale, xoffset = self.get_x_affine()
+        yscale, yoffset = self.get_y_affine()
         for k in range(point_len):
-            p = points[k]
-            x1 = x_px(p[0])
+            x, y = points[k]
+            if xlog:
+                x = log10(x)
+            if ylog:
+                y = log10(y)
+            x1 = x * xscale + xoffset
             x2 = x1 + bar_width
             y1 = ymin
-            y2 = y_px(p[1])
+            y2 = y * yscale + yoffset
 
             idx = k * 24
             # first triangle
@@ -1858,15 +2414,29 @@ class HBar(MeshLinePlot):
 
     def plot_mesh(self, *args):
         points = self.points
-        mesh, vert, ind = self.set_mesh_size(len(points) * 2)
-        mesh.mode = "lines"
+        self._mesh.mode = "lines"
 
         bounds = self.get_px_bounds()
         px_xmin = bounds["xmin"]
         px_xmax = bounds["xmax"]
-        y_px = self.y_px()
+        scale, offset = self.get_y_affine()
+        if np is not None:
+            ys = np.asarray(points, dtype=np.float64)
+            if self.params["ylog"]:
+                ys = np.log10(ys)
+            ys = ys * scale + offset
+            vert = self._mesh_buffer(len(ys) * 2)
+            vert[0::8] = px_xmin
+            vert[1::8] = ys
+            vert[4::8] = px_xmax
+            vert[5::8] = ys
+            self._upload_mesh(self._mesh, len(ys) * 2)
+            return
+        mesh, vert, ind = self.set_mesh_size(len(points) * 2)
+        if self.params["ylog"]:
+            points = map(log10, points)
         for k, y in enumerate(points):
-            y = y_px(y)
+            y = y * scale + offset
             vert[k * 8] = px_xmin
             vert[k * 8 + 1] = y
             vert[k * 8 + 4] = px_xmax
@@ -1880,15 +2450,29 @@ class VBar(MeshLinePlot):
 
     def plot_mesh(self, *args):
         points = self.points
-        mesh, vert, ind = self.set_mesh_size(len(points) * 2)
-        mesh.mode = "lines"
+        self._mesh.mode = "lines"
 
         bounds = self.get_px_bounds()
         px_ymin = bounds["ymin"]
         px_ymax = bounds["ymax"]
-        x_px = self.x_px()
+        scale, offset = self.get_x_affine()
+        if np is not None:
+            xs = np.asarray(points, dtype=np.float64)
+            if self.params["xlog"]:
+                xs = np.log10(xs)
+            xs = xs * scale + offset
+            vert = self._mesh_buffer(len(xs) * 2)
+            vert[0::8] = xs
+            vert[1::8] = px_ymin
+            vert[4::8] = xs
+            vert[5::8] = px_ymax
+            self._upload_mesh(self._mesh, len(xs) * 2)
+            return
+        mesh, vert, ind = self.set_mesh_size(len(points) * 2)
+        if self.params["xlog"]:
+            points = map(log10, points)
         for k, x in enumerate(points):
-            x = x_px(x)
+            x = x * scale + offset
             vert[k * 8] = x
             vert[k * 8 + 1] = px_ymin
             vert[k * 8 + 4] = x
@@ -1934,8 +2518,7 @@ class ScatterPlot(Plot):
 
     def draw(self, *args):
         super(ScatterPlot, self).draw(*args)
-        # flatten the list
-        self._gpts.points = list(chain(*self.iterate_points()))
+        self._gpts.points = self._flat_px_points()
 
     def draw_legend(self, center, maximum_size):
         self._maximum_legend_point_size = min(maximum_size) / 2
@@ -1988,7 +2571,7 @@ class PointPlot(Plot):
 
     def draw(self, *args):
         super(PointPlot, self).draw(*args)
-        self._point.points = [v for p in self.iterate_points() for v in p]
+        self._point.points = self._flat_px_points()
 
     def draw_legend(self, center, maximum_size):
         self._maximum_legend_point_size = min(maximum_size) / 2
@@ -2094,12 +2677,20 @@ class LineAndMarkerPlot(Plot):
         self._legend_group: Optional[InstructionGroup] = None
         self._legend_line: Optional[Line] = None
         self._legend_marker: Optional[Instruction] = None
+        # marker shape of the legend marker
+        self._legend_marker_shape: Optional[str] = None
         # store legend marker center and max size
         self._legend_marker_center: Optional[Tuple[float, float]] = None
         self._legend_maximum_drawing_size: Optional[Tuple[float, float]] = None
 
         # list of drawing instructions for the plot markers
         self._markers: List[Instruction] = []
+        # number of markers in use, the markers after these are hidden and kept for reuse
+        self._active_markers: int = 0
+        # marker shape of the markers in self._markers
+        self._markers_shape: Optional[str] = None
+        # markers that were replaced by markers of another shape, by shape, kept for reuse
+        self._marker_cache: Dict[Optional[str], List[Instruction]] = {}
 
         # call super
         super().__init__(**kwargs)
@@ -2150,7 +2741,7 @@ class LineAndMarkerPlot(Plot):
         # Set the line's points.
         # They have to be simplified (see method's doc).
         # They need another format: [(x0, y0), (x1, y1), ...] -> [x0, y0, x1, y1, ...]
-        self._line.points = [xy for p in self.simplify_points(list(self.iterate_points())) for xy in p]
+        self._line.points = list(chain.from_iterable(self.simplify_points(list(self.iterate_points()))))
         # Update all the markers of the plot.
         self.draw_markers()
 
@@ -2181,14 +2772,28 @@ class LineAndMarkerPlot(Plot):
 
         super().draw()
 
-        # Delete unneccessary markers.
-        while len(self.points) < len(self._markers) or (force_new and self._markers):
-            self._marker_group.remove(self._markers.pop())
+        n_points = len(self.points)
+
+        # Remove all markers, if they have to be created new, and keep them for a later reuse.
+        if force_new:
+            cache = self._marker_cache.setdefault(self._markers_shape, [])
+            while self._markers:
+                cache.append(self._markers.pop())
+                self._marker_group.remove(cache[-1])
+            self._active_markers = 0
+        if not self._markers:
+            self._markers_shape = self.marker_shape
+
+        # Hide unneccessary markers, instead of deleting them, so they can be reused
+        # without changing the instruction group when the number of points grows again.
+        for marker in self._markers[n_points:self._active_markers]:
+            self.hide_marker(marker)
+        self._active_markers = n_points
 
         # While we have less markers than needed, instantiate new ones.
-        while len(self.points) > len(self._markers):
+        while n_points > len(self._markers):
             # Keep references in self._markers, to change their position and shape.
-            self._markers.append(self.get_marker())
+            self._markers.append(self.reuse_marker())
             # Each marker is a drawing instruction that needs to be added to the correct InstructionGroup
             # in order to be displayed.
             self._marker_group.add(self._markers[-1])
@@ -2196,21 +2801,67 @@ class LineAndMarkerPlot(Plot):
         for marker, point in zip(self._markers, self.iterate_points()):
             self.draw_marker(marker, self.marker_size, *point)
 
+    def reuse_marker(self):
+        # This method returns a single marker like get_marker,
+        # but takes a marker of the same shape from the cache, if there is one.
+        cache = self._marker_cache.get(self.marker_shape)
+        if not cache:
+            return self.get_marker()
+        marker = cache.pop()
+        if isinstance(marker, Line):
+            marker.width = self.marker_line_width
+        return marker
+
+    @staticmethod
+    def hide_marker(marker: Instruction):
+        # Make a marker invisible, until it is drawn again by draw_marker.
+        if isinstance(marker, Line):
+            marker.points = []
+        elif isinstance(marker, Rectangle):
+            marker.size = 0, 0
+        elif isinstance(marker, Mesh):
+            marker.vertices = [0] * 16
+
     @staticmethod
     def simplify_points(points: List[Tuple[float, float]]):
         """Delete points in a list that lie exactly on the line connecting it's two adjacent points.
 
         This is needed due to a bug in class´SmoothLine´.
         """
-        points = points.copy()
-        i = 0
-        while len(points) > i + 2:
-            if 1e-5 > abs((points[i + 1][1] - points[i][1]) / (points[i + 1][0] - points[i][0]) -
-                          (points[i + 2][1] - points[i][1]) / (points[i + 2][0] - points[i][0])):
-                points.pop(i + 1)
-            else:
-                i += 1
-        return points
+        if len(points) < 3:
+            return list(points)
+        # Walk the points once, comparing the slopes from the last kept point
+        # to the pending point and to the next point. Points sharing the x
+        # coordinate of the last kept point are always kept.
+        simplified = [points[0]]
+        x0, y0 = points[0]
+        pending = points[1]
+        for i in range(2, len(points)):
+            x1, y1 = pending
+            x2, y2 = point = points[i]
+            if x1 == x0 or x2 == x0 or 1e-5 <= abs((y1 - y0) / (x1 - x0) - (y2 - y0) / (x2 - x0)):
+                simplified.append(pending)
+                x0, y0 = x1, y1
+            pending = point
+        simplified.append(pending)
+        return simplified
+
+    # The points of the markers drawn as a line, by shape. The functions take the left, center and right x,
+    # the bottom, center and top y and the offset d of the diagonal strokes of the marker.
+    _marker_points = {
+        'x': lambda x, cx, r, y, cy, t, d: (x, y, r, t, cx, cy, x, t, r, y),
+        '+': lambda x, cx, r, y, cy, t, d: (x, cy, r, cy, cx, cy, cx, y, cx, t),
+        '*': lambda x, cx, r, y, cy, t, d: (x, cy, r, cy, cx, cy, cx, y, cx, t, cx, cy, cx - d, cy - d,
+                                            cx + d, cy + d, cx, cy, cx - d, cy + d, cx + d, cy - d),
+        '-': lambda x, cx, r, y, cy, t, d: (x, cy, r, cy),
+        '|': lambda x, cx, r, y, cy, t, d: (cx, y, cx, t),
+        '>': lambda x, cx, r, y, cy, t, d: (x, y, r, cy, x, t),
+        '<': lambda x, cx, r, y, cy, t, d: (r, y, x, cy, r, t),
+        'v': lambda x, cx, r, y, cy, t, d: (x, t, cx, y, r, t),
+        '^': lambda x, cx, r, y, cy, t, d: (x, y, cx, t, r, y),
+        's': lambda x, cx, r, y, cy, t, d: (x, y, x, t, r, t, r, y, x, y, x, t),
+        'd': lambda x, cx, r, y, cy, t, d: (x, cy, cx, t, r, cy, cx, y, x, cy, cx, t),
+    }
 
     def draw_marker(self, marker: Instruction, s, x, y):
         # Set the line's points according to the desired position of the marker.
@@ -2219,22 +2870,9 @@ class LineAndMarkerPlot(Plot):
             return
         x, cx, r = x - s / 2, x, x + s / 2
         y, cy, t = y - s / 2, y, y + s / 2
-        d = .5 * sqrt(.5) * s
-        if shape in 'x+*-|<>v^sd':
-            marker.points = \
-                (x, y, r, t, cx, cy, x, t, r, y) if shape == 'x' else \
-                (x, cy, r, cy, cx, cy, cx, y, cx, t) if shape == '+' else \
-                (x, cy, r, cy, cx, cy, cx, y, cx, t, cx, cy, cx - d, cy - d, cx + d, cy + d, cx, cy, cx - d, cy + d, cx + d, cy - d) \
-                    if shape == '*' else \
-                (x, cy, r, cy) if shape == '-' else \
-                (cx, y, cx, t) if shape == '|' else \
-                (x, y, r, cy, x, t) if shape == '>' else \
-                (r, y, x, cy, r, t) if shape == '<' else \
-                (x, t, cx, y, r, t) if shape == 'v' else \
-                (x, y, cx, t, r, y) if shape == '^' else \
-                (x, y, x, t, r, t, r, y, x, y, x, t) if shape == 's' else \
-                (x, cy, cx, t, r, cy, cx, y, x, cy, cx, t) if shape == 'd' else \
-                NotImplemented
+        points = self._marker_points.get(shape)
+        if points is not None:
+            marker.points = points(x, cx, r, y, cy, t, .5 * sqrt(.5) * s)
         elif shape == 'o':
             marker.ellipse = (x, y, s, s)
         elif shape in 'OS':
@@ -2248,6 +2886,7 @@ class LineAndMarkerPlot(Plot):
     def create_legend_drawings(self):
         self._legend_line = SmoothLine(width=self.line_width)
         self._legend_marker = self.get_marker()
+        self._legend_marker_shape = self.marker_shape
         self._legend_group = InstructionGroup()
         self._legend_group.add(self._color)
         self._legend_group.add(self._legend_line)
@@ -2263,9 +2902,11 @@ class LineAndMarkerPlot(Plot):
         if force_new:
             if self._legend_marker:
                 self._legend_group.remove(self._legend_marker)
+                self._marker_cache.setdefault(self._legend_marker_shape, []).append(self._legend_marker)
                 self._legend_marker = None
             if not self.legend_display == 'line':
-                self._legend_marker = self.get_marker()
+                self._legend_marker = self.reuse_marker()
+                self._legend_marker_shape = self.marker_shape
                 self._legend_group.add(self._legend_marker)
         if self._legend_marker:
             marker_size = min(self.marker_size, *maximum_size)
@@ -2327,6 +2968,11 @@ if __name__ == '__main__':
             plot.points = [(x / 10., cos(x / 50.)) for x in range(-500, 501)]
             graph.add_plot(plot)
             self.plot = plot  # this is the moving graph, so keep a reference
+            if np is not None:
+                # its points as an array, the y values are updated in place
+                self.plot_points = np.empty((1001, 2))
+                self.plot_points[:, 0] = np.arange(-500, 501) / 10.
+                self.plot_phases = np.arange(-500, 501) / 50.
 
             plot = MeshStemPlot(color=next(colors))
             graph.add_plot(plot)
@@ -2337,7 +2983,7 @@ if __name__ == '__main__':
             plot.bind_to_graph(graph)
             plot.points = [(x, .1 + randrange(10) / 10.) for x in range(-50, 1)]
 
-            Clock.schedule_interval(self.update_points, 1 / 60.)
+            Clock.schedule_interval(self.update_points, 1 / 30.)
 
             graph2 = Graph(
                 xlabel='Position (m)',
@@ -2356,7 +3002,9 @@ if __name__ == '__main__':
             b.add_widget(graph)
 
             if np is not None:
+                self.make_contour_bases()
                 (xbounds, ybounds, data) = self.make_contour_data()
+                self.contour_ts = self.get_contour_ts()
                 # This is required to fit the graph to the data extents
                 graph2.xmin, graph2.xmax = xbounds
                 graph2.ymin, graph2.ymax = ybounds
@@ -2370,8 +3018,10 @@ if __name__ == '__main__':
 
                 b.add_widget(graph2)
                 self.contourplot = plot
+                # the data is computed alternately into these two arrays
+                self.contour_buffers = (data, np.empty_like(data))
 
-                Clock.schedule_interval(self.update_contour, 1 / 60.)
+                Clock.schedule_interval(self.update_contour, 1 / 30.)
 
             # Test the scatter plot
             plot = ScatterPlot(color=next(colors), point_size=5)
@@ -2379,38 +3029,79 @@ if __name__ == '__main__':
             plot.points = [(x, .1 + randrange(10) / 10.) for x in range(-50, 1)]
             return b
 
-        def make_contour_data(self, ts=0):
+        def make_contour_bases(self):
+            # The parts of the contour data that do not change over time
             omega = 2 * pi / 30
             k = (2 * pi) / 2.0
-
-            ts = sin(ts * 2) + 1.5  # emperically determined 'pretty' values
             npoints = 100
-            data = np.ones((npoints, npoints))
 
-            position = [ii * 0.1 for ii in range(npoints)]
-            time = [(ii % 100) * 0.6 for ii in range(npoints)]
-
-            for ii, t in enumerate(time):
-                for jj, x in enumerate(position):
-                    data[ii, jj] = sin(
-                        k * x + omega * t) + sin(-k * x + omega * t) / ts
-            return (0, max(position)), (0, max(time)), data
+            position = np.arange(npoints, dtype=float) * 0.1
+            # the times would wrap after 100 points, npoints is not larger
+            time = np.arange(npoints, dtype=float) * 0.6
+            self.contour_bounds = (
+                (0, float(position.max())), (0, float(time.max())))
+
+            # sin(t + x) + sin(t - x) / ts from the sines and cosines of the
+            # single angles, which makes it the product of a (time, 2) and a
+            # (2, position) matrix. Only the first is scaled by ts. float32 is
+            # plenty for display and halves the memory of the data
+            phase_x = k * position
+            phase_t = omega * time
+            self.contour_time_bases = np.column_stack(
+                (np.sin(phase_t), np.cos(phase_t))).astype(np.float32)
+            self.contour_times = np.empty_like(self.contour_time_bases)
+            self.contour_positions = np.vstack(
+                (np.cos(phase_x), np.sin(phase_x))).astype(np.float32)
+
+        @staticmethod
+        def get_contour_ts(ts=0):
+            return sin(ts * 2) + 1.5  # emperically determined 'pretty' values
+
+        def make_contour_data(self, ts=0, out=None):
+            ts = self.get_contour_ts(ts)
+
+            times = self.contour_times
+            np.multiply(
+                self.contour_time_bases, (1 + 1 / ts, 1 - 1 / ts), out=times)
+            # Rows are the times, columns the positions. The data is written
+            # into out, if given
+            if out is None:
+                out = np.empty(
+                    (len(times), self.contour_positions.shape[1]),
+                    dtype=np.float32)
+            data = np.matmul(times, self.contour_positions, out=out)
+            return self.contour_bounds + (data, )
 
         def update_points(self, *args):
-            self.plot.points = [
-                (x / 10., cos(Clock.get_time() + x / 50.))
-                for x in range(-500, 501)]
+            # one time for all the points of the frame
+            t = Clock.get_time()
+            # the points are replaced in place, which dispatches once and
+            # skips the comparison with the old points and their conversion
+            # by the property
+            if np is not None:
+                y = self.plot_points[:, 1]
+                np.add(t, self.plot_phases, out=y)
+                np.cos(y, out=y)
+                self.plot.points[:] = self.plot_points.tolist()
+                return
+            cos_ = cos
+            self.plot.points[:] = [
+                (x / 10., cos_(t + x / 50.)) for x in range(-500, 501)]
 
         def update_contour(self, *args):
-            _, _, self.contourplot.data[:] = self.make_contour_data(
-                Clock.get_time())
-            # this does not trigger an update, because we replace the
-            # values of the arry and do not change the object.
-            # However, we cannot do "...data = make_contour_data()" as
-            # kivy will try to check for the identity of the new and
-            # old values.  In numpy, 'nd1 == nd2' leads to an error
-            # (you have to use np.all).  Ideally, property should be patched
-            # for this.
-            self.contourplot.ask_draw()
+            t = Clock.get_time()
+            # the data changes by at most 4 * the change of ts, which is not
+            # visible below 1e-3
+            contour_ts = self.get_contour_ts(t)
+            if abs(contour_ts - self.contour_ts) < 1e-3:
+                return
+            self.contour_ts = contour_ts
+            # compute into the array that is not shown and assign it. data
+            # has force_dispatch, so kivy does not compare the arrays and
+            # the assignment always redraws the plot
+            buffers = self.contour_buffers
+            data = buffers[self.contourplot.data is buffers[0]]
+            self.make_contour_data(t, out=data)
+            self.contourplot.data = data
 
     TestApp().run()
@@ -0,0 +1,16 @@
+import pytest
+
+
+@pytest.mark.parametrize('size', [20, 3])
+def test_set_mesh_size_after_numpy_draw(size):
+    # set_mesh_size resizes the arrays set by the numpy plot_mesh
+    pytest.importorskip('numpy')
+    from kivy_garden.graph import MeshLinePlot
+    plot = MeshLinePlot()
+    plot.points = [(x, x) for x in range(10)]
+    plot.plot_mesh()
+    mesh, vert, ind = plot.set_mesh_size(size)
+    assert len(vert) == 4 * size
+    assert list(ind) == list(range(size))
+    assert len(mesh.vertices) == 4 * size
+    assert list(mesh.indices) == list(range(size))
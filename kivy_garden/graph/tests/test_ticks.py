@@ -0,0 +1,11 @@
+import pytest
+from math import log10
+
+
+@pytest.mark.parametrize('xmin', [0.06, 0.2, 2, 5, 20])
+def test_log_tick_at_xmin(xmin):
+    # the first tick sits exactly on the lower bound of the axis
+    from kivy_garden.graph import Graph
+    graph = Graph()
+    points_major, points_minor = graph._get_ticks(1, 10, True, xmin, 1000)
+    assert points_minor[0] == pytest.approx(log10(xmin))